@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# filepath: scripts/create_data_structure.py
+"""Set up the data/ directory layout the engine tools expect.
+
+Creates the master_calls/recordings/features directories, reports which
+master-call recordings still need to be dropped in, and writes a 440 Hz
+test tone so the audio pipeline can be exercised before any real
+recordings exist. Run from the scripts/ directory.
+"""
+
+import argparse
+import json
+import os
+import stat
+import struct
+import sys
+
+# Master calls the web player and tests reference (see
+# web/src/masterCalls.js and the master-call manager categories)
+CALLS = (
+    "buck_grunt", "doe_grunt", "fawn_bleat", "buck_bawl", "doe_bleat",
+    "estrus_bleat", "contact_bleat", "tending_grunts", "fawn_distress",
+    "snort_wheeze", "rattling",
+)
+
+# Filenames and status lines rendered once at import time, so the check
+# loop is just a set lookup plus one print per call
+CALL_FILES = tuple((f"{call}.wav",
+                    f"  ✓ {call}.wav - FOUND",
+                    f"  ✗ {call}.wav - MISSING")
+                   for call in CALLS)
+
+
+def _is_regular(path):
+    """True if path is an existing regular file.
+
+    One direct stat with no symlink follow and no extra wrapper layer,
+    and unlike os.path.exists a dangling symlink doesn't count as
+    present.
+    """
+    try:
+        return stat.S_ISREG(os.stat(path, follow_symlinks=False).st_mode)
+    except OSError:
+        return False
+
+
+def _scan_master_calls(master_dir, cache_path, write_cache=True):
+    """Return the set of filenames in master_dir, memoized on disk.
+
+    The snapshot is keyed to the directory's mtime, so repeated runs
+    (CI, dev loop) validate it with one stat instead of rescanning the
+    directory. Refreshes go through an atomic rename so an interrupted
+    run never leaves a torn cache behind.
+    """
+    try:
+        dir_mtime = os.stat(master_dir).st_mtime_ns
+    except OSError:
+        return set()
+
+    try:
+        with open(cache_path) as f:
+            cached_mtime, cached_names = json.load(f)
+        if cached_mtime == dir_mtime:
+            return set(cached_names)
+    except (OSError, ValueError):
+        pass
+
+    existing = {e.name for e in os.scandir(master_dir) if e.is_file()}
+
+    if write_cache:
+        tmp = cache_path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump([dir_mtime, sorted(existing)], f)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+
+    return existing
+
+
+def _maybe_write_test_tone(path):
+    """Write a 1 s 440 Hz test tone at path; no-op if numpy is missing.
+
+    numpy is imported here rather than at module level so re-runs that
+    already have the tone (the common case) skip the import entirely.
+    Returns a status line for the run summary, or None if the tone
+    already exists.
+    """
+    # O_EXCL creates and claims the file in one syscall: no stat-then-
+    # open TOCTOU window, and the already-exists case costs one syscall
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return None
+
+    try:
+        import numpy as np
+    except ImportError:
+        os.close(fd)
+        os.unlink(path)
+        return "\n  ! numpy not available - skipped test tone generation"
+
+    sample_rate = 44100
+    duration = 1.0
+    frequency = 440.0
+
+    n = int(sample_rate * duration)
+    w = 2.0 * np.pi * frequency / sample_rate
+    try:
+        # Two-term oscillator recurrence y[n] = 2cos(w)y[n-1] - y[n-2],
+        # run in C as an IIR filter over an impulse: n multiply-adds
+        # instead of n transcendental sin calls. Drift over one second
+        # at 440 Hz is far below the int16 quantization floor.
+        from scipy.signal import lfilter
+
+        impulse = np.zeros(n, dtype=np.float32)
+        impulse[0] = 1.0
+        tone = lfilter([0.0, np.sin(w)], [1.0, -2.0 * np.cos(w), 1.0],
+                       impulse)
+    except ImportError:
+        # Single float32 buffer, phase/sin/scale computed in place: no
+        # float64 temporaries, half the memory traffic. Sample index
+        # times w gives exact per-sample phase without linspace's
+        # endpoint-handling division.
+        tone = np.arange(n, dtype=np.float32)
+        np.multiply(tone, np.float32(w), out=tone)
+        np.sin(tone, out=tone)
+    np.multiply(tone, 0.5 * 32767, out=tone)
+    samples = tone.astype(np.int16, copy=False)
+
+    # 44-byte RIFF header written directly: mono 16-bit PCM.
+    # Skips the wave module's bookkeeping and its second pass to
+    # seek back and patch the chunk sizes.
+    data_size = n * 2
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size)
+    with os.fdopen(fd, "wb") as f:
+        f.write(header)
+        # memoryview exposes the int16 buffer directly, avoiding the
+        # full-buffer copy tobytes() would make
+        f.write(memoryview(samples))
+    return f"\n  ✓ Generated {path}"
+
+
+def create_data_structure(check_only=False, write_test_tone=True,
+                          parallel=False):
+    """Create the data/ layout and report missing master calls.
+
+    With check_only, nothing is created or written; the function just
+    probes what is there. With parallel, per-file stats on a thread
+    pool replace the directory scan (useful on network filesystems
+    where stat round-trips dominate or listing is denied). Returns the
+    number of missing master calls.
+    """
+    # Collect output and flush it in one write at the end: one syscall
+    # instead of a line-buffered flush per print
+    out = []
+
+    # Resolve relative paths against one cached getcwd instead of the
+    # getcwd syscall os.path.abspath makes per call
+    cwd = os.getcwd()
+
+    def _abs(path):
+        if os.path.isabs(path):
+            return path
+        return os.path.normpath(os.path.join(cwd, path))
+
+    parent = _abs("../data")
+
+    # Joined once and reused everywhere a leaf path is needed, so no
+    # path is ever re-derived (and can't normalize differently twice)
+    leaves = ("master_calls", "recordings", "features")
+    paths = {leaf: os.path.join(parent, leaf) for leaf in leaves}
+
+    if check_only:
+        out.append("Checking Huntmaster data directories...")
+        try:
+            existing_sub = {e.name for e in os.scandir(parent)}
+        except FileNotFoundError:
+            existing_sub = set()
+    else:
+        out.append("Setting up Huntmaster data directories...")
+        # Create the shared data/ parent once, then probe it with a
+        # single scandir and mkdir only the missing leaves; this avoids
+        # walking the mkdir-and-stat chain of os.makedirs three times
+        # over the same parent
+        os.makedirs(parent, exist_ok=True)
+        existing_sub = {e.name for e in os.scandir(parent)}
+        for leaf in leaves:
+            if leaf not in existing_sub:
+                os.mkdir(paths[leaf])
+            out.append(f"  ✓ {paths[leaf]}")
+
+    master_dir = paths["master_calls"]
+
+    # One mtime-validated scan builds the set of present recordings;
+    # each call check below is then a set lookup instead of its own
+    # stat syscall. A master_calls directory we just created is
+    # necessarily empty, so the parent probe above skips even that.
+    if parallel:
+        # Overlap the per-file stat round-trips on a small thread pool
+        # instead of scanning the directory
+        from concurrent.futures import ThreadPoolExecutor
+
+        names = [filename for filename, _, _ in CALL_FILES]
+        names.append("test_tone.wav")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            present = executor.map(
+                _is_regular,
+                (os.path.join(master_dir, name) for name in names))
+        existing = {name for name, found in zip(names, present) if found}
+    elif "master_calls" in existing_sub:
+        cache_path = os.path.join(parent, ".master_calls.cache")
+        existing = _scan_master_calls(master_dir, cache_path,
+                                      write_cache=not check_only)
+    else:
+        existing = set()
+
+    out.append("\nChecking master call recordings:")
+    missing = []
+    for filename, found_msg, missing_msg in CALL_FILES:
+        if filename in existing:
+            out.append(found_msg)
+        else:
+            out.append(missing_msg)
+            missing.append(filename)
+
+    if missing:
+        out.append(f"\nPlace the following {len(missing)} recording(s) in:")
+        out.append(f"  {master_dir}")
+        for filename in missing:
+            out.append(f"    - {filename}")
+
+    # Generate a synthetic test tone so the pipeline can run end-to-end;
+    # the scandir set already says whether it is there, so re-runs skip
+    # the path probe and the numpy import entirely
+    if (write_test_tone and not check_only
+            and "test_tone.wav" not in existing):
+        tone_line = _maybe_write_test_tone(
+            os.path.join(master_dir, "test_tone.wav"))
+        if tone_line:
+            out.append(tone_line)
+
+    out.append("\nNext steps:")
+    out.append("  1. Record or copy the missing master calls listed above")
+    out.append("  2. Run scripts/generate_call_index.py on the processed calls")
+    out.append("  3. Re-run the engine test targets")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+    return len(missing)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Set up the data/ directory layout for the engine")
+    parser.add_argument("--check-only", action="store_true",
+                        help="only report missing recordings; create nothing")
+    parser.add_argument("--no-test-tone", action="store_true",
+                        help="skip generating test_tone.wav")
+    parser.add_argument("--parallel", action="store_true",
+                        help="check recordings with parallel per-file stats "
+                             "(for network filesystems)")
+    args = parser.parse_args(argv)
+
+    missing = create_data_structure(check_only=args.check_only,
+                                    write_test_tone=not args.no_test_tone,
+                                    parallel=args.parallel)
+    # Only the pure check mode fails on missing recordings, so CI can
+    # gate on presence without the setup path ever failing
+    return 1 if (args.check_only and missing) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
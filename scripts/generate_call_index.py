@@ -4,59 +4,92 @@
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # fall back to the (slower) stdlib json
+    orjson = None
+
+
+def _dumps(obj):
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
 
 def generate_index(processed_dir):
     """Generate a comprehensive index of all processed master calls."""
 
-    index = {
-        "version": "1.0",
-        "generated": datetime.now().isoformat(),
-        "species": {},
-        "calls": []
-    }
-
     metadata_dir = Path(processed_dir) / "metadata"
 
-    for metadata_file in metadata_dir.glob("*.json"):
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
-
-        base_name = metadata_file.stem
-
-        call_entry = {
-            "id": base_name,
-            "species": metadata.get("species", "unknown"),
-            "callType": metadata.get("callType", "unknown"),
-            "season": metadata.get("season", "all"),
-            "difficulty": metadata.get("difficulty", 1),
-            "duration": metadata.get("duration", 0),
-            "files": {
-                # Adjust extension as needed
-                "audio": f"../master_calls/{base_name}.wav",
-                "mfc": f"mfc/{base_name}.mfc",
-                "waveform": f"waveforms/{base_name}.json",
-                "metadata": f"metadata/{base_name}.json"
+    # One scandir pass instead of Path.glob, which stats every match to
+    # build Path objects; plain path strings are also lighter to ship
+    # through the thread-pool map below.
+    try:
+        with os.scandir(metadata_dir) as entries:
+            paths = sorted(e.path for e in entries
+                           if e.name.endswith(".json") and e.is_file())
+    except FileNotFoundError:
+        paths = []
+
+    # Parse metadata files on a thread pool so the per-file reads overlap
+    # disk latency; the index itself is still built in a single-threaded
+    # pass below so ordering stays deterministic.
+    def _load(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        base_name = os.path.splitext(os.path.basename(path))[0]
+        return base_name, orjson.loads(data) if orjson else json.loads(data)
+
+    if paths:
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            results = list(executor.map(_load, paths))
+    else:
+        results = []
+
+    # Stream the index straight to disk: each call entry is serialized
+    # and written as it is consumed, so peak memory stays one entry plus
+    # the small species map instead of the whole corpus as Python dicts.
+    species_map = {}
+    call_count = 0
+    index_path = Path(processed_dir) / "index.json"
+
+    with open(index_path, 'wb') as f:
+        f.write(b'{"version": "1.0", "generated": '
+                + _dumps(datetime.now().isoformat())
+                + b', "calls": [\n')
+
+        for base_name, metadata in results:
+            call_entry = {
+                "id": base_name,
+                "species": metadata.get("species", "unknown"),
+                "callType": metadata.get("callType", "unknown"),
+                "season": metadata.get("season", "all"),
+                "difficulty": metadata.get("difficulty", 1),
+                "duration": metadata.get("duration", 0),
+                "files": {
+                    # Adjust extension as needed
+                    "audio": f"../master_calls/{base_name}.wav",
+                    "mfc": f"mfc/{base_name}.mfc",
+                    "waveform": f"waveforms/{base_name}.json",
+                    "metadata": f"metadata/{base_name}.json"
+                }
             }
-        }
 
-        index["calls"].append(call_entry)
+            if call_count:
+                f.write(b',\n')
+            f.write(_dumps(call_entry))
+            call_count += 1
 
-        # Group by species
-        species = metadata.get("species", "unknown")
-        if species not in index["species"]:
-            index["species"][species] = []
-        index["species"][species].append(base_name)
+            # Group by species
+            species = metadata.get("species", "unknown")
+            species_map.setdefault(species, []).append(base_name)
 
-    # Save index
-    index_path = Path(processed_dir) / "index.json"
-    with open(index_path, 'w') as f:
-        json.dump(index, f, indent=2)
+        f.write(b'\n], "species": ' + _dumps(species_map) + b'}\n')
 
-    print(f"Generated index with {len(index['calls'])} calls")
-    print(f"Species: {', '.join(index['species'].keys())}")
+    print(f"Generated index with {call_count} calls")
+    print(f"Species: {', '.join(species_map.keys())}")
 
     return index_path
 
@@ -1,35 +1,51 @@
 #!/usr/bin/env python3
 # serve_dev.py - Development server with proper CORS headers for WASM
 
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 import sys
 import os
 
+# Fixed per-response headers, encoded once at import time: the
+# COEP/COOP pair required for SharedArrayBuffer and WASM, the general
+# CORS set, and the forced WASM Content-Type
+_STATIC_HEADERS = (
+    b'Cross-Origin-Embedder-Policy: require-corp\r\n'
+    b'Cross-Origin-Opener-Policy: same-origin\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+    b'Access-Control-Allow-Headers: *\r\n'
+    b'Content-Type: application/wasm\r\n'
+)
+
+# Extension -> MIME type, one dict lookup instead of endswith chains
+_EXT_MIME = {
+    '.wasm': 'application/wasm',
+    '.js': 'application/javascript',
+    '.mjs': 'application/javascript',
+    '.json': 'application/json',
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.wav': 'audio/wav',
+}
+
 class CORSRequestHandler(SimpleHTTPRequestHandler):
+    # Keep-alive so the browser reuses connections across asset requests
+    protocol_version = 'HTTP/1.1'
+
     def end_headers(self):
-        # Required for SharedArrayBuffer and WASM
-        self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
-        self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
-        
-        # General CORS
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', '*')
-        
-        # WASM MIME type
-        self.send_header('Content-Type', 'application/wasm')
-        
+        # One buffered write instead of six formatted send_header calls
+        if self.request_version != 'HTTP/0.9':
+            self._headers_buffer.append(_STATIC_HEADERS)
         super().end_headers()
     
     def do_OPTIONS(self):
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def guess_type(self, path):
-        mimetype = super().guess_type(path)
-        if path.endswith('.wasm'):
-            return 'application/wasm'
-        return mimetype
+        mimetype = _EXT_MIME.get(os.path.splitext(path)[1].lower())
+        return mimetype if mimetype else super().guess_type(path)
 
 if __name__ == '__main__':
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
@@ -39,7 +55,10 @@ if __name__ == '__main__':
     if os.path.exists(web_dir):
         os.chdir(web_dir)
     
-    server = HTTPServer(('localhost', port), CORSRequestHandler)
+    # Threaded server so a large .wasm download doesn't block the
+    # dozen .wav/.js requests the page fires alongside it
+    server = ThreadingHTTPServer(('localhost', port), CORSRequestHandler)
+    server.daemon_threads = True
     print(f"🦌 Huntmaster Dev Server running at http://localhost:{port}/")
     print(f"📁 Serving from: {os.getcwd()}")
     print("Press Ctrl+C to stop...")
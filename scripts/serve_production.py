@@ -1,29 +1,61 @@
 #!/usr/bin/env python3
 # serve_production.py - Production-ready server with security headers
 
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 import sys
+import io
 import os
+import shutil
 import ssl
 import gzip
-import mimetypes
+import threading
 from pathlib import Path
 
+# Directory listings keyed by path -> (dir mtime, rendered HTML bytes);
+# regenerated only when the directory actually changes
+_listing_cache = {}
+_listing_lock = threading.Lock()
+
+# Fixed production security headers, encoded once at import time
+_SECURITY_HEADERS = (
+    b'Cross-Origin-Embedder-Policy: require-corp\r\n'
+    b'Cross-Origin-Opener-Policy: same-origin\r\n'
+    b'X-Content-Type-Options: nosniff\r\n'
+    b'X-Frame-Options: DENY\r\n'
+    b'X-XSS-Protection: 1; mode=block\r\n'
+    b'Strict-Transport-Security: max-age=31536000; includeSubDomains\r\n'
+)
+
+# Extension -> MIME type, one dict lookup instead of per-request
+# mimetypes registration and endswith chains
+_EXT_MIME = {
+    '.wasm': 'application/wasm',
+    '.js': 'application/javascript',
+    '.mjs': 'application/javascript',
+    '.json': 'application/json',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.css': 'text/css',
+    '.wav': 'audio/wav',
+    '.mp3': 'audio/mpeg',
+    '.ogg': 'audio/ogg',
+}
+
+
 class ProductionRequestHandler(SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        # Initialize MIME types
-        mimetypes.add_type('application/wasm', '.wasm')
-        mimetypes.add_type('application/javascript', '.js')
-        super().__init__(*args, **kwargs)
+    # HTTP/1.1 keep-alive lets one connection carry the whole burst of
+    # small asset requests instead of paying a TCP handshake per file
+    protocol_version = 'HTTP/1.1'
+
+    def guess_type(self, path):
+        mimetype = _EXT_MIME.get(os.path.splitext(path)[1].lower())
+        return mimetype if mimetype else super().guess_type(path)
 
     def end_headers(self):
-        # Security headers for production
-        self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
-        self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
-        self.send_header('X-Content-Type-Options', 'nosniff')
-        self.send_header('X-Frame-Options', 'DENY')
-        self.send_header('X-XSS-Protection', '1; mode=block')
-        self.send_header('Strict-Transport-Security', 'max-age=31536000; includeSubDomains')
+        # Security headers for production: fixed set, one buffered write
+        # instead of six formatted send_header calls
+        if self.request_version != 'HTTP/0.9':
+            self._headers_buffer.append(_SECURITY_HEADERS)
 
         # Cache control
         if self.path.endswith(('.wasm', '.js')):
@@ -36,32 +68,172 @@ class ProductionRequestHandler(SimpleHTTPRequestHandler):
         super().end_headers()
 
     def do_GET(self):
+        # Serve the pre-compressed variant when the client accepts gzip
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            translated = self.translate_path(self.path)
+            gz_path = translated + '.gz'
+            if not translated.endswith('.gz') and os.path.isfile(gz_path):
+                self._send_gzipped(translated, gz_path)
+                return
+
         # Handle WASM files with proper MIME type
         if self.path.endswith('.wasm'):
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/wasm')
-            self.send_header('Content-Encoding', 'identity')
-            self.end_headers()
-
             file_path = self.translate_path(self.path)
             try:
-                with open(file_path, 'rb') as f:
-                    self.wfile.write(f.read())
-            except FileNotFoundError:
+                f = open(file_path, 'rb')
+            except OSError:
                 self.send_error(404, "File not found")
+                return
+
+            with f:
+                size = os.fstat(f.fileno()).st_size
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/wasm')
+                self.send_header('Content-Encoding', 'identity')
+                self.send_header('Content-Length', str(size))
+                self.end_headers()
+                self._send_file_contents(f, size)
             return
 
         # Default handling for other files
         super().do_GET()
 
+    def list_directory(self, path):
+        # Avoid re-scanning and re-rendering unchanged directories on
+        # every hit; one stat on the directory validates the cache
+        try:
+            dir_mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+
+        if dir_mtime is not None:
+            with _listing_lock:
+                cached = _listing_cache.get(path)
+            if cached is not None and cached[0] == dir_mtime:
+                body = cached[1]
+                self.send_response(200)
+                self.send_header('Content-type',
+                                 'text/html; charset=%s' % sys.getfilesystemencoding())
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                return io.BytesIO(body)
+
+        f = super().list_directory(path)
+        if f is not None and dir_mtime is not None:
+            with _listing_lock:
+                _listing_cache[path] = (dir_mtime, f.getvalue())
+        return f
+
+    def _send_gzipped(self, original_path, gz_path):
+        try:
+            f = open(gz_path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(original_path))
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length', str(size))
+            self.end_headers()
+            self._send_file_contents(f, size)
+
+    def copyfile(self, source, outputfile):
+        # Route regular files (audio, JS, ...) through sendfile as well
+        if outputfile is self.wfile and hasattr(source, 'fileno'):
+            try:
+                size = os.fstat(source.fileno()).st_size
+            except (OSError, ValueError):
+                size = None
+            if size is not None:
+                self._send_file_contents(source, size)
+                return
+        super().copyfile(source, outputfile)
+
+    def _send_file_contents(self, source, size):
+        """Send an open file over the socket with zero-copy os.sendfile.
+
+        The kernel moves pages straight from the page cache to the
+        socket, skipping both userspace copies of f.read()/wfile.write().
+        Falls back to a plain buffered copy if sendfile is unavailable.
+        """
+        # sendfile writes to the raw fd, which would bypass the TLS
+        # record layer and garble every HTTPS body; encrypt through the
+        # buffered path instead
+        if isinstance(self.connection, ssl.SSLSocket):
+            source.seek(0)
+            shutil.copyfileobj(source, self.wfile)
+            return
+
+        self.wfile.flush()
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(self.wfile.fileno(), source.fileno(),
+                                   offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            source.seek(offset)
+            shutil.copyfileobj(source, self.wfile)
+
+class _ProductionServer(ThreadingHTTPServer):
+    """Threaded server so concurrent static requests (WASM, audio, JS)
+    overlap instead of serializing behind one connection, with a deeper
+    accept backlog so connection bursts queue in the kernel instead of
+    being refused while worker threads are busy."""
+    request_queue_size = 128
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+# Asset types worth pre-compressing; audio is already compressed
+_COMPRESSIBLE = ('.js', '.json', '.html', '.htm', '.css', '.wasm')
+
+
+def _precompress(root):
+    """Write side-by-side .gz copies of compressible assets under root.
+
+    Runs once at startup so no request ever pays for compression; stale
+    .gz files (older than their source) are rewritten, current ones are
+    left alone.
+    """
+    compressed = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if not name.endswith(_COMPRESSIBLE):
+                continue
+            src = os.path.join(dirpath, name)
+            dst = src + '.gz'
+            try:
+                if (os.path.exists(dst)
+                        and os.path.getmtime(dst) >= os.path.getmtime(src)):
+                    continue
+                with open(src, 'rb') as fin, \
+                        gzip.open(dst, 'wb', compresslevel=9) as fout:
+                    shutil.copyfileobj(fin, fout)
+                compressed += 1
+            except OSError:
+                continue
+    return compressed
+
+
 def run_server(port=8080, directory=None, use_ssl=False, cert_file=None, key_file=None):
     """Run the production server"""
 
     if directory:
         os.chdir(directory)
 
+    compressed = _precompress(os.getcwd())
+    if compressed:
+        print(f"Pre-compressed {compressed} static asset(s)")
+
     server_address = ('', port)
-    httpd = HTTPServer(server_address, ProductionRequestHandler)
+    httpd = _ProductionServer(server_address, ProductionRequestHandler)
 
     if use_ssl and cert_file and key_file:
         # Setup SSL context
@@ -12,17 +12,9 @@ import datetime
 from pathlib import Path
 
 
-class CoverageHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/':
-            self.send_visualization_page()
-        elif self.path == '/data':
-            self.send_coverage_data()
-        else:
-            super().do_GET()
-
-    def send_visualization_page(self):
-        html_content = """
+# Dashboard template; only the footer timestamp is dynamic, so the page
+# is pre-encoded once at import time and split around that slot
+DASHBOARD_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -131,12 +123,32 @@ class CoverageHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     </footer>
 </body>
 </html>
-        """.format(timestamp=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        """
+
+_PAGE_PREFIX, _PAGE_SUFFIX = (part.encode()
+                              for part in DASHBOARD_TEMPLATE.split('{timestamp}'))
+
+
+class CoverageHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/':
+            self.send_visualization_page()
+        elif self.path == '/data':
+            self.send_coverage_data()
+        else:
+            super().do_GET()
+
+    def send_visualization_page(self):
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S").encode()
 
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
+        self.send_header('Content-Length',
+                         str(len(_PAGE_PREFIX) + len(timestamp) + len(_PAGE_SUFFIX)))
         self.end_headers()
-        self.wfile.write(html_content.encode())
+        self.wfile.write(_PAGE_PREFIX)
+        self.wfile.write(timestamp)
+        self.wfile.write(_PAGE_SUFFIX)
 
     def send_coverage_data(self):
         data = {
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# filepath: tests/unit/generate_test_audio.py
+"""Generate the deterministic WAV fixtures used by the unit test suite.
+
+Writes 16-bit mono PCM files (test_sine_440.wav, test_complex.wav, ...)
+into data/master_calls so MFCC/DTW tests have known-content audio to
+chew on. Safe to re-run; existing fixtures are overwritten.
+"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import soundfile as sf
+except ImportError:  # libsndfile not installed; fall back to stdlib wave
+    sf = None
+
+SAMPLE_RATE = 44100
+OUTPUT_DIR = Path(__file__).resolve().parents[2] / "data" / "master_calls"
+
+# Time vectors keyed by (sample_rate, duration); the fixtures share the
+# same grid, so build it once instead of re-running linspace per file.
+# Callers must treat the cached array as read-only.
+_T_CACHE = {}
+
+
+def _time_vec(sample_rate, duration):
+    key = (sample_rate, duration)
+    t = _T_CACHE.get(key)
+    if t is None:
+        t = np.linspace(0, duration, int(sample_rate * duration),
+                        endpoint=False, dtype=np.float32)
+        _T_CACHE[key] = t
+    return t
+
+
+def create_sine_wave(filename, frequency, duration,
+                     sample_rate=SAMPLE_RATE, amplitude=0.5):
+    """Create a pure sine tone and write it as 16-bit mono PCM."""
+    t = _time_vec(sample_rate, duration)
+    buf = np.multiply(t, np.float32(2 * np.pi * frequency))
+    np.sin(buf, out=buf)
+    samples = _to_int16(buf, amplitude * 32767.0)
+    _write_wav(filename, samples, sample_rate)
+
+
+def create_complex_wave(filename, frequencies, amplitudes, duration,
+                        sample_rate=SAMPLE_RATE):
+    """Create a harmonic stack (e.g. a simulated grunt) as 16-bit mono PCM.
+
+    All harmonics are synthesized with one vectorized np.sin over the
+    (harmonics x samples) phase matrix and folded down with a single
+    BLAS matrix-vector product instead of accumulating per-harmonic in
+    a Python loop.
+    """
+    t = _time_vec(sample_rate, duration)
+    freqs = np.asarray(frequencies, dtype=np.float32)[:, None]
+    amps = np.asarray(amplitudes, dtype=np.float32)
+    combined_samples = amps @ np.sin((2 * np.pi * freqs) * t)
+
+    # Fold the peak normalization into the int16 scale factor so the
+    # buffer is walked once instead of a divide pass then a multiply pass
+    peak = float(np.max(np.abs(combined_samples)))
+    scale = (0.5 * 32767.0) / max(peak, 1e-12)
+    samples = _to_int16(combined_samples, scale)
+    _write_wav(filename, samples, sample_rate)
+
+
+def _to_int16(samples, scale):
+    """Scale a float sample buffer in place and cast it to int16 PCM.
+
+    Runs the scale and rounding through the caller's buffer via out=
+    parameters so the conversion allocates only the final int16 array
+    instead of a chain of float temporaries.
+    """
+    np.multiply(samples, np.float32(scale), out=samples)
+    np.rint(samples, out=samples)
+    return samples.astype(np.int16, copy=False)
+
+
+def _write_wav(filename, samples, sample_rate):
+    if sf is not None:
+        # libsndfile takes the int16 array straight through its C API,
+        # skipping the Python-level bytes copy the wave module needs.
+        sf.write(str(filename), samples, sample_rate, subtype="PCM_16")
+    else:
+        with wave.open(str(filename), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(samples.tobytes())
+    print(f"  ✓ {filename}")
+
+
+if __name__ == "__main__":
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    print("Generating unit-test audio fixtures...")
+    create_sine_wave(OUTPUT_DIR / "test_sine_440.wav", 440.0, 2.0)
+    create_complex_wave(OUTPUT_DIR / "test_complex.wav",
+                        [220.0, 440.0, 880.0, 1760.0],
+                        [1.0, 0.6, 0.35, 0.2], 2.0)
+    create_complex_wave(OUTPUT_DIR / "test_grunt.wav",
+                        [90.0, 180.0, 270.0, 360.0],
+                        [1.0, 0.7, 0.45, 0.25], 1.5)
+    print("Done.")